@@ -1,6 +1,7 @@
 import inspect
 import re
-from typing import Union, Dict, Any, Optional
+import struct
+from typing import Union, Dict, Any, Optional, List, Tuple
 from importlib import import_module
 
 from yfiles_jupyter_graphs import GraphWidget
@@ -10,6 +11,13 @@ POSSIBLE_NODE_BINDINGS = {'coordinate', 'color', 'size', 'type', 'styles', 'scal
 POSSIBLE_EDGE_BINDINGS = {'color', 'thickness_factor', 'property', 'label', 'styles'}
 SPARQL_LABEL_KEYS = ['name', 'title', 'text', 'description', 'caption', 'label']
 
+SNAPSHOT_MAGIC = b'YJGS'
+SNAPSHOT_VERSION = 1
+# magic, version, string count, string blob size, triple count, node count, node property count,
+# edge count, edge property count
+_SNAPSHOT_HEADER = struct.Struct('<4sHIIIIIII')
+_INDEX = struct.Struct('<i')
+
 
 def _try_import(module_name: str, graph_type_name: str):
     try:
@@ -40,6 +48,122 @@ def extract_label(term, edge):
         return s
 
 
+def _index_column(values) -> bytes:
+    """
+        Encodes string table indices as a little-endian int32 column
+    """
+    return struct.pack(f'<{len(values)}i', *values)
+
+
+def _read_index_column(buffer, offset: int, count: int) -> Tuple[tuple, int]:
+    return struct.unpack_from(f'<{count}i', buffer, offset), offset + count * _INDEX.size
+
+
+def _encode_snapshot(triples: List[tuple], nodes: List[Dict], edges: List[Dict]) -> bytes:
+    """
+        Encodes triples, nodes and edges column-wise, referencing every string by its index in a shared string table
+    """
+    strings = {}
+
+    def intern(value) -> int:
+        if value is None:
+            return -1
+        value = str(value)
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    triple_columns = [[intern(row[i]) for row in triples] for i in range(3)]
+
+    node_ids = [intern(node['id']) for node in nodes]
+    node_property_counts = [len(node['properties']) for node in nodes]
+    node_property_keys = [intern(key) for node in nodes for key in node['properties']]
+    node_property_values = [intern(value) for node in nodes for value in node['properties'].values()]
+
+    edge_ids = [intern(edge.get('id')) for edge in edges]
+    edge_starts = [intern(edge['start']) for edge in edges]
+    edge_ends = [intern(edge['end']) for edge in edges]
+    edge_property_counts = [len(edge['properties']) for edge in edges]
+    edge_property_keys = [intern(key) for edge in edges for key in edge['properties']]
+    edge_property_values = [intern(value) for edge in edges for value in edge['properties'].values()]
+
+    # lone surrogates may occur in query results and would otherwise fail to encode
+    encoded_strings = [value.encode('utf-8', 'surrogatepass') for value in strings]
+    blob = b''.join(encoded_strings)
+    header = _SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(encoded_strings), len(blob),
+                                   len(triples), len(nodes), len(node_property_keys),
+                                   len(edges), len(edge_property_keys))
+    columns = [[len(value) for value in encoded_strings], *triple_columns,
+               node_ids, node_property_counts, node_property_keys, node_property_values,
+               edge_ids, edge_starts, edge_ends, edge_property_counts, edge_property_keys, edge_property_values]
+    return b''.join([header, *(_index_column(column) for column in columns), blob])
+
+
+def _decode_snapshot(buffer) -> Tuple[List[tuple], List[Dict], List[Dict]]:
+    """
+        Decodes a buffer written by `_encode_snapshot` back into triples, nodes and edges
+    """
+    if len(buffer) < _SNAPSHOT_HEADER.size:
+        raise Exception('not a valid graph snapshot')
+    (magic, version, string_count, blob_size, triple_count, node_count, node_property_count,
+     edge_count, edge_property_count) = _SNAPSHOT_HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise Exception('not a valid graph snapshot')
+    if version != SNAPSHOT_VERSION:
+        raise Exception(f'unsupported graph snapshot version {version}')
+
+    offset = _SNAPSHOT_HEADER.size
+    column_counts = [string_count, triple_count, triple_count, triple_count,
+                     node_count, node_count, node_property_count, node_property_count,
+                     edge_count, edge_count, edge_count, edge_count, edge_property_count, edge_property_count]
+    if len(buffer) != offset + _INDEX.size * sum(column_counts) + blob_size:
+        raise Exception('not a valid graph snapshot')
+    columns = []
+    for count in column_counts:
+        column, offset = _read_index_column(buffer, offset, count)
+        columns.append(column)
+    (string_lengths, subjects, predicates, objects,
+     node_ids, node_property_counts, node_property_keys, node_property_values,
+     edge_ids, edge_starts, edge_ends, edge_property_counts, edge_property_keys, edge_property_values) = columns
+
+    index_columns = [subjects, predicates, objects, node_ids, node_property_keys, node_property_values,
+                     edge_ids, edge_starts, edge_ends, edge_property_keys, edge_property_values]
+    if (any(length < 0 for length in string_lengths) or sum(string_lengths) != blob_size
+            or any(count < 0 for count in node_property_counts) or sum(node_property_counts) != node_property_count
+            or any(count < 0 for count in edge_property_counts) or sum(edge_property_counts) != edge_property_count
+            or any(not -1 <= index < string_count for column in index_columns for index in column)):
+        raise Exception('not a valid graph snapshot')
+
+    strings = []
+    try:
+        for length in string_lengths:
+            strings.append(bytes(buffer[offset:offset + length]).decode('utf-8', 'surrogatepass'))
+            offset += length
+    except UnicodeDecodeError:
+        raise Exception('not a valid graph snapshot')
+
+    def lookup(index: int):
+        return strings[index] if index >= 0 else None
+
+    triples = [(lookup(s), lookup(p), lookup(o)) for s, p, o in zip(subjects, predicates, objects)]
+
+    def elements(counts, keys, values):
+        position = 0
+        for count in counts:
+            yield {lookup(keys[i]): lookup(values[i]) for i in range(position, position + count)}
+            position += count
+
+    nodes = [{'id': lookup(node_id), 'properties': properties}
+             for node_id, properties in zip(node_ids, elements(node_property_counts, node_property_keys,
+                                                               node_property_values))]
+    edges = [{'id': lookup(edge_id), 'start': lookup(start), 'end': lookup(end), 'properties': properties}
+             for edge_id, start, end, properties in zip(edge_ids, edge_starts, edge_ends,
+                                                        elements(edge_property_counts, edge_property_keys,
+                                                                 edge_property_values))]
+    return triples, nodes, edges
+
+
 def safe_delete_configuration(key: str, configurations: Dict[str, Any]) -> None:
     if key == "*":
         configurations.clear()
@@ -59,6 +183,10 @@ class SparqlGraphWidget:
         self._wrapper = wrapper
         self._graph_layout = layout
         self.graph = None
+        self._lastQueryResult = []
+        # None until a graph was built, an empty query result is still a graph that can be saved
+        self._nodes = None
+        self._edges = None
 
     def set_limit(self, limit):
         self.limit = limit
@@ -107,8 +235,6 @@ class SparqlGraphWidget:
                     if s or p or o:
                         triples.append((s, p, o))
 
-                self._lastQueryResult = triples
-
                 return triples
             # DESCRIBE, CONSTRUCT query
 
@@ -123,14 +249,54 @@ class SparqlGraphWidget:
         res = self._query(query)
         try:
             widget = self._create_graph(res)
-            if layout:
-                widget.graph_layout = layout
-            else:
-                widget.graph_layout = self._graph_layout
-            self.widget = widget
         except TypeError:
             raise Exception('This widget can only visualize Select, Describe and Construct queries')
 
+        self._show_widget(widget, layout)
+
+    def save_snapshot(self, path: str) -> None:
+        """
+        Saves the graph of the last query to a compact binary file, so it can be restored without querying the endpoint again.
+
+        Only the queried data is stored. The configurations are applied again when the snapshot is loaded.
+
+        Args:
+            path (str): The file the snapshot is written to.
+
+        Returns:
+            None
+        """
+        if self._nodes is None:
+            raise Exception('no graph to save, run show_query first')
+
+        with open(path, 'wb') as file:
+            file.write(_encode_snapshot(self._lastQueryResult, self._nodes, self._edges))
+
+    def load_snapshot(self, path: str, layout: Optional[str] = None) -> None:
+        """
+        Restores and shows a graph that was saved with `save_snapshot`, applying the current configurations.
+
+        Args:
+            path (str): The snapshot file.
+            layout (Optional[str]): The graph layout that is used. By default, the general layout of this instance is used.
+
+        Returns:
+            None
+        """
+        with open(path, 'rb') as file:
+            triples, nodes, edges = _decode_snapshot(file.read())
+
+        self._lastQueryResult = triples
+        self._nodes = nodes
+        self._edges = edges
+        self._show_widget(self._apply_configurations(nodes, edges), layout)
+
+    def _show_widget(self, widget, layout=None):
+        if layout:
+            widget.graph_layout = layout
+        else:
+            widget.graph_layout = self._graph_layout
+        self.widget = widget
         widget.show()
 
     def _create_graph(self, triples):
@@ -143,10 +309,12 @@ class SparqlGraphWidget:
                 i += 1
             return None
 
+        # configurations are matched against the triples this graph is built from,
+        # CONSTRUCT and DESCRIBE results do not pass the SELECT branch in _query
+        triples = list(triples)
         existing_nodes = []  # store created node labels in here
         nodes = []
         edges = []
-        widget = GraphWidget()
         for row in triples:
             s = row[0]
             p = row[1]
@@ -183,6 +351,13 @@ class SparqlGraphWidget:
                 edges.append({'id': p_extracted_label, 'start': s_label, 'end': o_label,
                               'properties': {'label': p_extracted_label, 'full_label': p_label}})
 
+        self._lastQueryResult = triples
+        self._nodes = nodes
+        self._edges = edges
+        return self._apply_configurations(nodes, edges)
+
+    def _apply_configurations(self, nodes, edges):
+        widget = GraphWidget()
         widget.nodes = nodes
         widget.edges = edges
         widget.directed = True
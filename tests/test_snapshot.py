@@ -0,0 +1,98 @@
+import struct
+
+import pytest
+
+yfiles_jupyter_graphs = pytest.importorskip('yfiles_jupyter_graphs')
+
+from yfiles_jupyter_graphs_for_sparql import SparqlGraphWidget
+from yfiles_jupyter_graphs_for_sparql.Yfiles_Sparql_Graphs import _SNAPSHOT_HEADER, _encode_snapshot, \
+    _decode_snapshot
+
+TRIPLES = [('http://example.org/köln', 'http://example.org/ns#partOf', 'http://example.org/nrw'),
+           ('http://example.org/a', None, '\ud800')]
+NODES = [{'id': 'http://example.org/köln', 'properties': {'label': 'köln', 'note': None}},
+         {'id': 'http://example.org/nrw', 'properties': {}}]
+EDGES = [{'id': 'partOf', 'start': 'http://example.org/köln', 'end': 'http://example.org/nrw',
+          'properties': {'label': 'partOf'}},
+         {'id': None, 'start': 'http://example.org/nrw', 'end': 'http://example.org/nrw', 'properties': {}}]
+
+
+def patch_column(buffer: bytes, position: int, value: int) -> bytes:
+    """
+        Overwrites the index at `position`, counted over all columns following the header
+    """
+    offset = _SNAPSHOT_HEADER.size + 4 * position
+    return buffer[:offset] + struct.pack('<i', value) + buffer[offset + 4:]
+
+
+def test_round_trip():
+    assert _decode_snapshot(_encode_snapshot(TRIPLES, NODES, EDGES)) == (TRIPLES, NODES, EDGES)
+
+
+def test_round_trip_empty():
+    assert _decode_snapshot(_encode_snapshot([], [], [])) == ([], [], [])
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda b: b'',
+    lambda b: b[:_SNAPSHOT_HEADER.size - 1],
+    lambda b: b[:len(b) // 2],
+    lambda b: b[:-1],
+    lambda b: b[:-4],
+    lambda b: b + b'\0',
+    lambda b: b'XXXX' + b[4:],
+    # string lengths are [1, 1, 1], followed by the subject index
+    lambda b: patch_column(b, 3, 3),
+    lambda b: patch_column(b, 3, -2),
+    lambda b: patch_column(patch_column(b, 0, -1), 1, 3),
+    lambda b: patch_column(b, 0, 2),
+    # node property count of the single node
+    lambda b: patch_column(b, 7, 2),
+    lambda b: b[:-1] + b'\xff',
+], ids=['empty', 'header', 'half', 'byte', 'column', 'padded', 'magic', 'index', 'negative index',
+        'negative length', 'length sum', 'property count', 'utf-8'])
+def test_invalid_snapshot(corrupt):
+    buffer = _encode_snapshot([('a', 'b', 'c')], [{'id': 'a', 'properties': {'b': 'c'}}], [])
+    assert _decode_snapshot(buffer)
+    with pytest.raises(Exception, match='not a valid graph snapshot'):
+        _decode_snapshot(corrupt(buffer))
+
+
+def test_save_requires_graph(tmp_path):
+    with pytest.raises(Exception, match='no graph to save'):
+        SparqlGraphWidget().save_snapshot(tmp_path / 'graph.snapshot')
+
+
+def test_load_applies_current_configurations(tmp_path, monkeypatch):
+    pytest.importorskip('rdflib')
+    monkeypatch.setattr(yfiles_jupyter_graphs.GraphWidget, 'show', lambda self: None)
+    path = tmp_path / 'graph.snapshot'
+
+    saved = SparqlGraphWidget()
+    saved._create_graph([('http://example.org/john', 'http://example.org/ns#memberOf', 'http://example.org/band')])
+    saved.save_snapshot(path)
+
+    loaded = SparqlGraphWidget(layout='hierarchic')
+    loaded.add_subject_configuration('memberOf', parent_configuration='Beatles')
+    loaded.load_snapshot(path)
+
+    widget = loaded.widget
+    assert widget.graph_layout == 'hierarchic'
+    assert [node['id'] for node in widget.nodes] == ['http://example.org/john', 'http://example.org/band',
+                                                      'GroupNodeBeatles']
+    parent_mapping = widget.get_node_parent_mapping()
+    assert parent_mapping(0, widget.nodes[0]) == 'GroupNodeBeatles'
+
+
+def test_save_empty_graph(tmp_path, monkeypatch):
+    pytest.importorskip('rdflib')
+    monkeypatch.setattr(yfiles_jupyter_graphs.GraphWidget, 'show', lambda self: None)
+    path = tmp_path / 'graph.snapshot'
+
+    saved = SparqlGraphWidget()
+    saved._create_graph([])
+    saved.save_snapshot(path)
+
+    loaded = SparqlGraphWidget()
+    loaded.load_snapshot(path)
+    assert loaded.widget.nodes == []